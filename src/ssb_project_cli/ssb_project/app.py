@@ -9,9 +9,6 @@ from typing_extensions import Annotated
 
 from ssb_project_cli.ssb_project.util import set_debug_logging
 
-from .build.build import build_project
-from .clean.clean import clean_project
-from .create.create import create_project
 from .create.repo_privacy import RepoPrivacy
 from .settings import CURRENT_WORKING_DIRECTORY
 from .settings import GITHUB_ORG_NAME
@@ -99,6 +96,9 @@ def create(  # noqa: C901, S107
     ] = False,
 ) -> None:
     """:sparkles:  Create a project locally, and optionally on GitHub with the flag --github. The project will follow SSB's best practice for development."""
+    # Imported here to keep startup fast, e.g. for --help
+    from .create.create import create_project
+
     if not checkout and template_git_url is STAT_TEMPLATE_REPO_URL:
         checkout = STAT_TEMPLATE_DEFAULT_REFERENCE
 
@@ -141,6 +141,8 @@ def build(
     ] = False,
 ) -> None:
     """:wrench:  Create a virtual environment and corresponding Jupyter kernel. Runs in the current folder if no arguments are supplied."""
+    from .build.build import build_project
+
     build_project(
         path,
         CURRENT_WORKING_DIRECTORY,
@@ -155,10 +157,20 @@ def build(
 def clean(
     project_name: str = typer.Argument(  # noqa: B008
         ..., help="The name of the project/kernel you want to delete."
-    )
+    ),
+    assume_yes: Annotated[
+        bool,
+        typer.Option(
+            "--yes",
+            "-y",
+            help="Delete the kernel and the virtual environment without asking for confirmation.",
+        ),
+    ] = False,
 ) -> None:
     """:broom:  Delete the kernel for the given project name."""
-    clean_project(project_name)
+    from .clean.clean import clean_project
+
+    clean_project(project_name, assume_yes)
 
 
 def main() -> None:
@@ -1,23 +1,58 @@
 """Build command module."""
 
+import contextlib
+import importlib
 import json
 import os
-import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import ModuleType
+from typing import Any
 from typing import List
 
-import kvakk_git_tools.validate_ssb_gitconfig  # type: ignore
 from rich import print
 
 from ssb_project_cli.ssb_project.util import (
     get_kernels_dict,
     get_project_name_and_root_path,
+    invalidate_kernels_dict,
 )
 
 from .environment import verify_local_config
 from .poetry import check_and_remove_onprem_source, install_ipykernel, poetry_install
 from .prompt import confirm_fix_ssb_git_config
+from .validation_cache import is_git_config_validated
+from .validation_cache import mark_git_config_validated
+
+
+_PYTHON_EXECUTABLE_SUFFIXES = ("/python3", "/python", "/python.sh")
+
+
+def _import_orjson() -> ModuleType | None:
+    """Import orjson if it is installed, it is an optional speedup."""
+    try:
+        return importlib.import_module("orjson")
+    except ImportError:
+        return None
+
+
+orjson = _import_orjson()
+
+
+def _json_loads(data: bytes) -> Any:
+    """Deserialize JSON, using orjson if it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to UTF-8 encoded JSON, using orjson if it is installed."""
+    if orjson is not None:
+        data: bytes = orjson.dumps(obj)
+        return data
+    return json.dumps(obj).encode("utf-8")
 
 
 def build_project(
@@ -61,6 +96,7 @@ def build_project(
     poetry_install(project_root)
     if not no_kernel:
         install_ipykernel(project_root, project_name)
+        invalidate_kernels_dict()
         ipykernel_attach_bashrc(project_name)
 
 
@@ -75,17 +111,23 @@ def validate_and_fix_git_config(
         project_name: The name of the project
         project_root: The root directory of the project/repo.
     """
-    try:
-        valid_global_git_config = kvakk_git_tools.validate_git_config()
-    except FileExistsError:
-        # If gitconfig does not exist the configuration is invalid
-        valid_global_git_config = False
-    valid_project_git_config = verify_local_config(
-        template_repo_url,
-        checkout,
-        cwd=str(project_root),
-    )
-    if not valid_global_git_config or not valid_project_git_config:
+    if is_git_config_validated(template_repo_url, checkout, project_root):
+        return
+
+    # Both checks block on subprocesses or a clone, so run them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        global_git_config = executor.submit(_validate_global_git_config)
+        project_git_config = executor.submit(
+            verify_local_config,
+            template_repo_url,
+            checkout,
+            cwd=str(project_root),
+        )
+        valid_global_git_config = global_git_config.result()
+        valid_project_git_config = project_git_config.result()
+    if valid_global_git_config and valid_project_git_config:
+        mark_git_config_validated(template_repo_url, checkout, project_root)
+    else:
         print(
             ":x:\tYour project's Git configuration does not follow SSB recommendations,\n:x:\twhich may result in sensitive data being pushed to GitHub."
         )
@@ -99,6 +141,22 @@ def validate_and_fix_git_config(
         )
 
 
+def _validate_global_git_config() -> bool:
+    """Validate the global git config with 'kvakk-git-tools'.
+
+    Returns:
+        True if the global git config follows SSB recommendations, else False.
+    """
+    import kvakk_git_tools.validate_ssb_gitconfig  # type: ignore
+
+    try:
+        valid: bool = kvakk_git_tools.validate_git_config()
+    except FileExistsError:
+        # If gitconfig does not exist the configuration is invalid
+        valid = False
+    return valid
+
+
 def ipykernel_attach_bashrc(project_name: str) -> None:
     """Attaches bashrc to the project kernel by modifying ipykernel files.
 
@@ -112,23 +170,18 @@ def ipykernel_attach_bashrc(project_name: str) -> None:
         )
         sys.exit(1)
 
-    project_kernel_path = kernels[project_name]["resource_dir"]
-    if not Path(project_kernel_path).exists():
-        print(
-            f":x:\tCould not mount .bashrc, path: '{project_kernel_path}' does not exist."  # noqa: B907
-        )
-        sys.exit(1)
-
+    project_kernel_path = kernels[project_name]
     kernel_json_file = f"{project_kernel_path}/kernel.json"
-    if not Path(kernel_json_file).exists():
+    try:
+        with open(kernel_json_file, "rb") as f:
+            content_as_json = _json_loads(f.read())
+    except FileNotFoundError:
+        # Also covers a missing kernel directory, no need to check it separately
         print(
             f":x:\tCould not mount .bashrc, file: '{kernel_json_file}' does not exist."  # noqa: B907
         )
         sys.exit(1)
 
-    with open(kernel_json_file, encoding="utf-8") as f:
-        content_as_json = json.loads(f.read())
-
     python_executable_path = _get_python_executable_path(content_as_json["argv"])
     if python_executable_path is None:
         print(
@@ -151,14 +204,20 @@ def ipykernel_attach_bashrc(project_name: str) -> None:
         "{connection_file}",
     ]
 
-    with open(kernel_json_file, "w", encoding="utf-8") as f:
-        f.write(json.dumps(content_as_json))
+    # Write to a temporary file first so an interrupted build never leaves a broken kernel.json
+    temp_kernel_json_file = f"{kernel_json_file}.tmp"
+    try:
+        with open(temp_kernel_json_file, "wb") as f:
+            f.write(_json_dumps(content_as_json))
+        os.replace(temp_kernel_json_file, kernel_json_file)
+    except BaseException:
+        # Don't leave the temporary file behind in the kernel directory
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(temp_kernel_json_file)
+        raise
 
     _write_start_script(start_script_path, python_executable_path)
 
-    # set rx to everyone, required for jupyterlab to get permission to call start script
-    os.chmod(start_script_path, 0o555)  # noqa: S103
-
 
 def _get_python_executable_path(argv: List[str]) -> str | None:
     """Searches for any entry which ends with python.
@@ -168,23 +227,27 @@ def _get_python_executable_path(argv: List[str]) -> str | None:
 
     Returns: Path to python executable if it exists, otherwise None
     """
-    pattern = r"^.*(?:/python3|/python|/python\.sh)$"
-    matches = [entry for entry in argv if re.match(pattern, entry)]
-    return matches[0] if len(matches) >= 1 else None
+    for entry in argv:
+        if entry.endswith(_PYTHON_EXECUTABLE_SUFFIXES):
+            return entry
+    return None
 
 
 def _write_start_script(start_script_path: str, python_executable_path: str) -> None:
     """Write the start script content to the specified path.
 
+    The script is made readable and executable for everyone.
+
     Args:
         start_script_path: Path to create the start script
         python_executable_path: Path to the python executable
     """
-    with open(start_script_path, "w", encoding="utf-8") as f:
-        f.writelines(
-            [
-                "#!/usr/bin/env bash\n",
-                "source $HOME/.bashrc\n",
-                f"exec {python_executable_path} $@",
-            ]
-        )
+    content = f"#!/usr/bin/env bash\nsource $HOME/.bashrc\nexec {python_executable_path} $@\n".encode()
+    fd = os.open(start_script_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o555)
+    try:
+        os.write(fd, content)
+        # set rx to everyone, required for jupyterlab to get permission to call start script.
+        # The mode given to os.open is subject to the umask, so set it explicitly.
+        os.fchmod(fd, 0o555)  # noqa: S103
+    finally:
+        os.close(fd)
@@ -2,7 +2,6 @@
 
 import os
 from pathlib import Path
-from kvakk_git_tools import ssb_gitconfig  # type: ignore
 from rich import print
 
 from ssb_project_cli.ssb_project.build.temp_template_repo import TempTemplateRepo
@@ -92,6 +91,9 @@ def reset_global_gitconfig() -> None:
     This function attempts to configure the global gitconfig using the 'kvakk-git-tools' module.
     If the configuration fails, an error message is printed indicating the platform's support status.
     """
+    # Imported here to keep startup fast, it is only needed when fixing the gitconfig
+    from kvakk_git_tools import ssb_gitconfig  # type: ignore
+
     print("\nConfiguring git with 'kvakk-git-tools':")
 
     try:
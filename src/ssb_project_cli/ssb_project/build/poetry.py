@@ -3,6 +3,7 @@
 import os
 from pathlib import Path
 
+import tomli
 from rich import print
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
@@ -67,11 +68,34 @@ def poetry_update_lockfile_dependencies(project_directory: Path) -> None:
         )
 
 
+def _pyproject_includes_source_name(cwd: Path, source_name: str) -> bool:
+    """Check whether pyproject.toml declares this source, without starting Poetry.
+
+    Args:
+        cwd: Path of project
+        source_name: Name of source to check
+
+    Returns:
+        True if the source is declared, or if pyproject.toml could not be parsed
+    """
+    try:
+        with open(cwd / "pyproject.toml", "rb") as f:
+            pyproject = tomli.load(f)
+    except (OSError, tomli.TOMLDecodeError):
+        # Let Poetry decide
+        return True
+
+    sources = pyproject.get("tool", {}).get("poetry", {}).get("source", [])
+    return any(source.get("name") == source_name for source in sources)
+
+
 def poetry_source_includes_source_name(
     cwd: Path, source_name: str = NEXUS_SOURCE_NAME
 ) -> bool:
     """Check whether this source is already added to the project.
 
+    Poetry is only invoked if pyproject.toml declares the source.
+
     Args:
         cwd: Path of project to add source to
         source_name: Name of source to check
@@ -79,6 +103,9 @@ def poetry_source_includes_source_name(
     Returns:
         True if the source exists in the list
     """
+    if not _pyproject_includes_source_name(cwd, source_name):
+        return False
+
     result = execute_command(
         "poetry source show".split(" "),
         "poetry-source-show",
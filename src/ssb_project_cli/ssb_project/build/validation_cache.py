@@ -0,0 +1,132 @@
+"""This module caches successful git configuration validations between builds."""
+
+import json
+import os
+import platform
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any
+
+from ssb_project_cli.ssb_project.settings import HOME_PATH
+
+
+def _cache_file(home_path: Path) -> Path:
+    """Path of the validation cache file."""
+    return home_path / ".cache" / "ssb-project" / "git-config-validated.json"
+
+
+def _mtime(path: Path) -> int | None:
+    """Modification time of path in nanoseconds, None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _package_version(name: str) -> str | None:
+    """Installed version of the package, None if it is not installed."""
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return None
+
+
+def _fingerprint(
+    template_repo_url: str, checkout: str | None, project_root: Path, home_path: Path
+) -> dict[str, Any]:
+    """Collect everything the git configuration validation depends on.
+
+    Args:
+        template_repo_url: Template repository url
+        checkout: The git reference to check against. Supports branches, tags and commit hashes.
+        project_root: The root directory of the project/repo.
+        home_path: System home path
+
+    Returns:
+        The template reference, the versions shipping the recommended configuration,
+        the platform inputs selecting it and the modification times of the validated files.
+    """
+    return {
+        "template_repo_url": template_repo_url,
+        "checkout": checkout,
+        "versions": {
+            name: _package_version(name)
+            for name in ["kvakk-git-tools", "ssb-project-cli"]
+        },
+        # The inputs kvakk-git-tools uses to pick the recommended gitconfig, except
+        # for the host pings which are too slow to run on every build
+        "platform": {
+            "system": platform.system(),
+            "DAPLA_REGION": os.environ.get("DAPLA_REGION"),
+            "SESSIONNAME": os.environ.get("SESSIONNAME"),
+        },
+        "mtimes": {
+            name: _mtime(path)
+            for name, path in [
+                ("gitconfig", home_path / ".gitconfig"),
+                ("git/config", project_root / ".git" / "config"),
+                (".gitattributes", project_root / ".gitattributes"),
+                (".gitignore", project_root / ".gitignore"),
+            ]
+        },
+    }
+
+
+def _read_cache(home_path: Path) -> dict[str, Any]:
+    """Read the validation cache, an unreadable cache is treated as empty."""
+    try:
+        with open(_cache_file(home_path), "rb") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def is_git_config_validated(
+    template_repo_url: str,
+    checkout: str | None,
+    project_root: Path,
+    home_path: Path = HOME_PATH,
+) -> bool:
+    """Check if the git configuration was found valid and has not changed since.
+
+    Args:
+        template_repo_url: Template repository url
+        checkout: The git reference to check against. Supports branches, tags and commit hashes.
+        project_root: The root directory of the project/repo.
+        home_path: System home path
+
+    Returns:
+        True if a previous validation with identical inputs succeeded, else False.
+    """
+    cached = _read_cache(home_path).get(str(project_root))
+    return cached == _fingerprint(template_repo_url, checkout, project_root, home_path)
+
+
+def mark_git_config_validated(
+    template_repo_url: str,
+    checkout: str | None,
+    project_root: Path,
+    home_path: Path = HOME_PATH,
+) -> None:
+    """Remember that the git configuration of the project is valid.
+
+    Args:
+        template_repo_url: Template repository url
+        checkout: The git reference to check against. Supports branches, tags and commit hashes.
+        project_root: The root directory of the project/repo.
+        home_path: System home path
+    """
+    cache = _read_cache(home_path)
+    cache[str(project_root)] = _fingerprint(
+        template_repo_url, checkout, project_root, home_path
+    )
+    cache_file = _cache_file(home_path)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError:
+        # The cache is only an optimization, failing to write it is not an error
+        return
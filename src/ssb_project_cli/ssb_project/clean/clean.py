@@ -1,67 +1,96 @@
 """Clean command module."""
 
+import shutil
 import sys
 from pathlib import Path
 
 import questionary
 from rich import print
 
-from ssb_project_cli.ssb_project.util import execute_command
+from ssb_project_cli.ssb_project.util import create_error_log
 from ssb_project_cli.ssb_project.util import get_kernels_dict
 from ssb_project_cli.ssb_project.util import remove_kernel_spec
 
 
-def clean_project(project_name: str) -> None:
+KERNEL_CHOICE = "kernel"
+VENV_CHOICE = "venv"
+
+
+def clean_project(project_name: str, assume_yes: bool = False) -> None:
     """Removes the kernel and/or virtual environment of an SSB-project.
 
     Args:
         project_name: Project name
+        assume_yes: Delete both the kernel and the virtual environment without prompting.
     """
-    clean_venv()
-
     kernels = get_kernels_dict()
+    kernel_found = project_name in kernels
 
-    if project_name not in kernels:
+    if not kernel_found:
+        # The virtual environment can still be removed, e.g. for projects built with --no-kernel
         print(
             "Could not find kernel {!r}. Is the project name spelled correctly?".format(
                 project_name
             )
         )
 
+    if assume_yes:
+        selected = [VENV_CHOICE]
+        if kernel_found:
+            selected.append(KERNEL_CHOICE)
+    else:
+        choices = [
+            questionary.Choice(
+                "The virtual environment in the current directory", value=VENV_CHOICE
+            )
+        ]
+        if kernel_found:
+            choices.insert(
+                0,
+                questionary.Choice(
+                    f"The kernel {project_name!r}", value=KERNEL_CHOICE, checked=True
+                ),
+            )
+        # A single prompt for both questions, so prompt_toolkit only starts once
+        selected = questionary.checkbox(
+            "Select what to delete. Deleting the kernel leaves all other files untouched.",
+            choices=choices,
+        ).ask()
+
+    if not selected:
         sys.exit(1)
 
-    confirmation = questionary.confirm(
-        "Are you sure you want to delete the kernel {!r}. This action will delete the kernel associated with the virtual environment and leave all other files untouched.".format(
-            project_name
-        )
-    ).ask()
+    if VENV_CHOICE in selected:
+        clean_venv()
 
-    if not confirmation:
-        sys.exit(1)
+    if KERNEL_CHOICE in selected:
+        print(
+            f"Deleting kernel {project_name}...If you wish to also delete the project files, you can do so manually."
+        )
 
-    print(
-        f"Deleting kernel {project_name}...If you wish to also delete the project files, you can do so manually."
-    )
+        remove_kernel_spec(project_name)
 
-    remove_kernel_spec(project_name)
+    if not kernel_found:
+        sys.exit(1)
 
 
 def clean_venv() -> None:
-    """Removes the virtual environment for project if it exists in current directory. If not, user is prompted for path to ssb project."""
-    confirm = questionary.confirm(
-        "Do you also wish to delete the virtual environment for this project?"
-    ).ask()
-    if confirm:
-        if Path(".venv").is_dir():
-            clean_venv_cmd = "rm -rf .venv"
-
-            execute_command(
-                clean_venv_cmd,
-                "clean-virtualenv",
-                "Virtual environment successfully removed!",
-                "Something went wrong while removing virtual environment in current directory. A log of the issue was created...",
-                None,
+    """Removes the virtual environment for project if it exists in current directory."""
+    venv_path = Path(".venv")
+    if venv_path.is_symlink() or venv_path.is_dir():
+        try:
+            if venv_path.is_symlink():
+                # rmtree refuses symlinks, only remove the link like 'rm -rf' would
+                venv_path.unlink()
+            else:
+                shutil.rmtree(venv_path)
+        except OSError as e:
+            print(
+                "Something went wrong while removing virtual environment in current directory. A log of the issue was created..."
             )
+            create_error_log(repr(e), "clean-virtualenv")
+            sys.exit(1)
+        print("Virtual environment successfully removed!")
 
-        else:
-            print("No virtual environment found in current directory. Skipping...")
+    else:
+        print("No virtual environment found in current directory. Skipping...")
@@ -10,13 +10,20 @@ from github import BadCredentialsException
 from github import Github
 from github import GithubException
 
-from ssb_project_cli.ssb_project import prompt_autocomplete_style
 from ssb_project_cli.ssb_project.build.environment import JUPYTER_IMAGE_SPEC
 from ssb_project_cli.ssb_project.build.environment import running_onprem
 from ssb_project_cli.ssb_project.settings import GITHUB_ORG_NAME
 from ssb_project_cli.ssb_project.util import create_error_log
 
 
+prompt_autocomplete_style = questionary.Style(
+    [
+        ("answer", "fg:#000000 bold"),  # submitted answer text behind the question
+        ("selected", "fg:#FFFFFF"),  # style for a selected item
+    ]
+)
+
+
 def create_github(
     github_token: str,
     repo_name: str,
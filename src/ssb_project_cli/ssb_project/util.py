@@ -1,5 +1,7 @@
 """SSB-project utils."""
 
+import contextlib
+import functools
 import json
 import logging
 import os
@@ -7,17 +9,26 @@ import subprocess  # noqa: S404
 import sys  # noqa: S404
 import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import Optional
 from typing import Union
 
-import jupyter_client
 import tomli
 from rich import print
 
 from .settings import HOME_PATH
 
 
-kernelspec_manager = jupyter_client.kernelspec.KernelSpecManager()
+if TYPE_CHECKING:
+    from jupyter_client.kernelspec import KernelSpecManager
+
+
+@functools.lru_cache(maxsize=1)
+def _kernelspec_manager() -> "KernelSpecManager":
+    """Create the kernel spec manager on first use, jupyter_client is slow to import."""
+    from jupyter_client.kernelspec import KernelSpecManager
+
+    return KernelSpecManager()
 
 
 def set_debug_logging(home_path: Path = HOME_PATH) -> None:
@@ -104,18 +115,29 @@ def execute_command(
     return result
 
 
-def get_kernels_dict() -> dict[str, dict[str, str]]:
-    """Gets installed kernel specifications.
+@functools.lru_cache(maxsize=1)
+def get_kernels_dict() -> dict[str, str]:
+    """Gets installed kernels and their resource directories.
+
+    Only scans the kernel directories, the kernel.json files are not parsed.
+    The result is cached for the lifetime of the process, call
+    invalidate_kernels_dict() after installing or removing a kernel.
 
     Returns:
-        kernel_dict: Dictionary of installed kernel specifications
+        kernel_dict: Dictionary mapping kernel names to their resource directories
     """
-    return kernelspec_manager.get_all_specs()
+    return _kernelspec_manager().find_kernel_specs()
+
+
+def invalidate_kernels_dict() -> None:
+    """Clear the cached result of get_kernels_dict()."""
+    get_kernels_dict.cache_clear()
 
 
 def remove_kernel_spec(kernel_name: str) -> None:
     """Remove a kernel spec."""
-    kernelspec_manager.remove_kernel_spec(kernel_name)
+    _kernelspec_manager().remove_kernel_spec(kernel_name)
+    invalidate_kernels_dict()
 
 
 def get_project_name_and_root_path(
@@ -137,18 +159,22 @@ def get_project_name_and_root_path(
     cruft_json_name = ".cruft.json"
     pyproject_name = "pyproject.toml"
     origin = project_path or Path.cwd()
-    if not origin.exists():
-        return None, None
     paths = [origin]
     # List of current path and all parents up to the filesystem root
     paths.extend(origin.parents)
 
     for path in paths:
-        if {i.name for i in path.iterdir()}.intersection(
-            {cruft_json_name, pyproject_name, ".git"}
-        ):
-            try:
-                # Attempt to source from Cruft first
+        # A single directory listing tells which of the files below exist
+        try:
+            names = {entry.name for entry in os.scandir(path)}
+        except FileNotFoundError:
+            return None, None
+        if not names.intersection({cruft_json_name, pyproject_name, ".git"}):
+            continue
+
+        if cruft_json_name in names:
+            # Attempt to source from Cruft first
+            with contextlib.suppress(KeyError, FileNotFoundError, json.JSONDecodeError):
                 name = json.loads((path / cruft_json_name).read_text())["context"][
                     "cookiecutter"
                 ]["project_name"]
@@ -156,19 +182,18 @@ def get_project_name_and_root_path(
                     name,
                     path,
                 )
-            except (KeyError, FileNotFoundError, json.JSONDecodeError):
-                # Fall back to pyproject.toml
-                try:
-                    name = tomli.loads((path / pyproject_name).read_text())["tool"][
-                        "poetry"
-                    ]["name"]
-                    return (
-                        name,
-                        path,
-                    )
-                except (KeyError, FileNotFoundError):
-                    # Final fall back to project root directory name
-                    return path.name, path
+        if pyproject_name in names:
+            # Fall back to pyproject.toml
+            with contextlib.suppress(KeyError, FileNotFoundError):
+                name = tomli.loads((path / pyproject_name).read_text())["tool"][
+                    "poetry"
+                ]["name"]
+                return (
+                    name,
+                    path,
+                )
+        # Final fall back to project root directory name
+        return path.name, path
     return None, None
 
 
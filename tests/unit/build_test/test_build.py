@@ -9,9 +9,13 @@ from unittest.mock import patch
 import pytest
 
 from ssb_project_cli.ssb_project.build.build import _get_python_executable_path
+from ssb_project_cli.ssb_project.build.build import _import_orjson
+from ssb_project_cli.ssb_project.build.build import _json_dumps
+from ssb_project_cli.ssb_project.build.build import _json_loads
 from ssb_project_cli.ssb_project.build.build import _write_start_script
 from ssb_project_cli.ssb_project.build.build import build_project
 from ssb_project_cli.ssb_project.build.build import ipykernel_attach_bashrc
+from ssb_project_cli.ssb_project.build.build import validate_and_fix_git_config
 from ssb_project_cli.ssb_project.settings import STAT_TEMPLATE_DEFAULT_REFERENCE
 from ssb_project_cli.ssb_project.settings import STAT_TEMPLATE_REPO_URL
 
@@ -25,10 +29,14 @@ BUILD = "ssb_project_cli.ssb_project.build.build"
 @patch(f"{BUILD}.ipykernel_attach_bashrc")
 @patch("typer.confirm")
 @patch("kvakk_git_tools.validate_git_config")
-@patch("ssb_project_cli.ssb_project.build.environment.verify_local_config")
+@patch(f"{BUILD}.verify_local_config")
 @patch(f"{BUILD}.get_project_name_and_root_path")
+@patch(f"{BUILD}.is_git_config_validated", return_value=False)
+@patch(f"{BUILD}.mark_git_config_validated")
 @pytest.mark.parametrize("no_kernel", [False, True])
 def test_build(
+    mock_mark_git_config_validated: Mock,
+    mock_is_git_config_validated: Mock,
     mock_get_project_name_and_root_path: Mock,
     mock_verify_local_config: Mock,
     mock_kvakk: Mock,
@@ -42,7 +50,7 @@ def test_build(
 ) -> None:
     """Check that build calls poetry_install, install_ipykernel and poetry_source_includes_source_name."""
     mock_kvakk.return_value = True
-    mock_verify_local_config.return_value = True
+    mock_verify_local_config.return_value = False
     mock_confirm.return_value = False
     mock_get_project_name_and_root_path.return_value = ("project_name", tmp_path)
     build_project(
@@ -54,21 +62,71 @@ def test_build(
         no_kernel,
     )
     assert mock_kvakk.called
-    assert mock_verify_local_config
+    assert mock_verify_local_config.called
     assert mock_confirm.call_count == 1
+    assert mock_mark_git_config_validated.call_count == 0
     assert mock_poetry_install.call_count == 1
     assert mock_install_ipykernel.call_count == int(not no_kernel)
     assert mock_ipykernel_attach_bashrc.call_count == int(not no_kernel)
     assert mock_check_and_remove_onprem_source.call_count == 1
 
 
+@patch(f"{BUILD}.confirm_fix_ssb_git_config")
+@patch("kvakk_git_tools.validate_git_config")
+@patch(f"{BUILD}.verify_local_config")
+@patch(f"{BUILD}.is_git_config_validated")
+@patch(f"{BUILD}.mark_git_config_validated")
+@pytest.mark.parametrize(
+    "cached,valid_global,valid_project,validated,marked,prompted",
+    [
+        (True, True, True, False, False, False),
+        (False, True, True, True, True, False),
+        (False, False, True, True, False, True),
+        (False, True, False, True, False, True),
+    ],
+)
+def test_validate_and_fix_git_config(
+    mock_mark_git_config_validated: Mock,
+    mock_is_git_config_validated: Mock,
+    mock_verify_local_config: Mock,
+    mock_kvakk: Mock,
+    mock_confirm_fix_ssb_git_config: Mock,
+    cached: bool,
+    valid_global: bool,
+    valid_project: bool,
+    validated: bool,
+    marked: bool,
+    prompted: bool,
+    tmp_path: Path,
+) -> None:
+    """Check that a cached validation skips the checks and a successful one is cached."""
+    mock_is_git_config_validated.return_value = cached
+    mock_kvakk.return_value = valid_global
+    mock_verify_local_config.return_value = valid_project
+
+    validate_and_fix_git_config(
+        STAT_TEMPLATE_REPO_URL,
+        STAT_TEMPLATE_DEFAULT_REFERENCE,
+        "project_name",
+        tmp_path,
+    )
+
+    assert mock_kvakk.call_count == int(validated)
+    assert mock_verify_local_config.call_count == int(validated)
+    assert mock_mark_git_config_validated.call_count == int(marked)
+    assert mock_confirm_fix_ssb_git_config.call_count == int(prompted)
+    if marked:
+        mock_mark_git_config_validated.assert_called_once_with(
+            STAT_TEMPLATE_REPO_URL, STAT_TEMPLATE_DEFAULT_REFERENCE, tmp_path
+        )
+
+
 @patch(f"{BUILD}.get_kernels_dict")
 @patch("builtins.print")
 @patch("builtins.exit")
-@patch(f"{BUILD}.Path.exists", side_effect=[True, True, True])
 @patch("builtins.open", new_callable=mock_open)
 @patch(
-    f"{BUILD}.json.loads",
+    f"{BUILD}._json_loads",
     return_value={
         "argv": [
             "some/path/bin/python3",
@@ -80,26 +138,25 @@ def test_build(
     },
 )
 @patch(
-    f"{BUILD}.json.dumps",
-    return_value='{"argv": ["/bin/python3", "-m", "ipykernel_launcher", "-f", "{connection_file}"]}',
+    f"{BUILD}._json_dumps",
+    return_value=b'{"argv": ["/bin/python3", "-m", "ipykernel_launcher", "-f", "{connection_file}"]}',
 )
 @patch(f"{BUILD}._get_python_executable_path", return_value="/some/path/python3")
 @patch(f"{BUILD}._write_start_script")
-@patch(f"{BUILD}.os.chmod", return_value=True)
+@patch(f"{BUILD}.os.replace")
 def test_ipykernel_attach_bashrc_success(
-    mock_chmod: Mock,
+    mock_replace: Mock,
     mock_write_start_script: Mock,
     mock_get_python_executable_path: Mock,
     mock_json_dumps: Mock,
     mock_json_loads: Mock,
     mock_file_open: Mock,
-    mock_path_exist: Mock,
     mock_exit: Mock,
     mock_print: Mock,
     mock_get_kernels_dict: Mock,
 ) -> None:
     mock_get_kernels_dict.return_value = {
-        "project_name": {"resource_dir": "/path/to/project/kernel"}
+        "project_name": "/path/to/project/kernel"
     }
     project_name = "project_name"
 
@@ -108,13 +165,15 @@ def test_ipykernel_attach_bashrc_success(
     assert mock_get_kernels_dict.call_count == 1
     assert mock_print.call_count == 0
     assert mock_exit.call_count == 0
-    assert mock_path_exist.call_count == 2
     assert mock_file_open.call_count == 2
     assert mock_json_loads.call_count == 1
     assert mock_json_dumps.call_count == 1
     assert mock_get_python_executable_path.call_count == 1
     assert mock_write_start_script.call_count == 1
-    assert mock_chmod.call_count == 1
+    mock_replace.assert_called_once_with(
+        "/path/to/project/kernel/kernel.json.tmp",
+        "/path/to/project/kernel/kernel.json",
+    )
 
 
 @patch(
@@ -139,34 +198,11 @@ def test_ipykernel_attach_bashrc_kernel_not_found(
 
 @patch(
     f"{BUILD}.get_kernels_dict",
-    return_value={"existing_project": {"resource_dir": "/path/which/does/not/exist"}},
-)
-@patch(f"{BUILD}.Path.exists", side_effect=[False])
-@patch(f"{BUILD}.print")
-def test_ipykernel_attach_bashrc_kernel_path_does_not_exist(
-    mock_print: Mock, mock_exists: Mock, mock_get_kernels_dict: Mock
-) -> None:
-    project_name = "existing_project"
-    expected_print_message = ":x:\tCould not mount .bashrc, path: '/path/which/does/not/exist' does not exist."
-    expected_exit_code = 1
-
-    with unittest.TestCase().assertRaises(SystemExit) as cm:
-        ipykernel_attach_bashrc(project_name)
-
-    assert mock_get_kernels_dict.call_count == 1
-    assert mock_exists.call_count == 1
-    assert mock_print.call_args[0][0] == expected_print_message
-    assert cm.exception.code == expected_exit_code
-
-
-@patch(
-    f"{BUILD}.get_kernels_dict",
-    return_value={"existing_project": {"resource_dir": "/path/which/does/not/exist"}},
+    return_value={"existing_project": "/path/which/does/not/exist"},
 )
-@patch(f"{BUILD}.Path.exists", side_effect=[True, False])
 @patch(f"{BUILD}.print")
 def test_ipykernel_attach_bashrc_kernel_json_file_not_exist(
-    mock_print: Mock, mock_exists: Mock, mock_get_kernels_dict: Mock
+    mock_print: Mock, mock_get_kernels_dict: Mock
 ) -> None:
     project_name = "existing_project"
     expected_print_message = ":x:\tCould not mount .bashrc, file: '/path/which/does/not/exist/kernel.json' does not exist."
@@ -176,19 +212,17 @@ def test_ipykernel_attach_bashrc_kernel_json_file_not_exist(
         ipykernel_attach_bashrc(project_name)
 
     assert mock_get_kernels_dict.call_count == 1
-    assert mock_exists.call_count == 2
     assert mock_print.call_args[0][0] == expected_print_message
     assert cm.exception.code == expected_exit_code
 
 
 @patch(
     f"{BUILD}.get_kernels_dict",
-    return_value={"existing_project": {"resource_dir": "/path/which/does/not/exist"}},
+    return_value={"existing_project": "/path/which/does/not/exist"},
 )
-@patch(f"{BUILD}.Path.exists", side_effect=[True, True])
 @patch("builtins.open", new_callable=mock_open)
 @patch(
-    f"{BUILD}.json.loads",
+    f"{BUILD}._json_loads",
     return_value={
         "argv": [
             "some/path/bin/doesnotexist",
@@ -204,7 +238,6 @@ def test_ipykernel_attach_bashrc_python_executable_path_not_found(
     mock_print: Mock,
     mock_json_loads: Mock,
     mock_file_open: Mock,
-    mock_exists: Mock,
     mock_get_kernels_dict: Mock,
 ) -> None:
     project_name = "existing_project"
@@ -215,7 +248,6 @@ def test_ipykernel_attach_bashrc_python_executable_path_not_found(
         ipykernel_attach_bashrc(project_name)
 
     assert mock_get_kernels_dict.call_count == 1
-    assert mock_exists.call_count == 2
     assert mock_file_open.call_count == 1
     assert mock_json_loads.call_count == 1
     assert mock_print.call_args[0][0] == expected_print_message
@@ -224,12 +256,11 @@ def test_ipykernel_attach_bashrc_python_executable_path_not_found(
 
 @patch(
     f"{BUILD}.get_kernels_dict",
-    return_value={"existing_project": {"resource_dir": "/path/which/does/not/exist"}},
+    return_value={"existing_project": "/path/which/does/not/exist"},
 )
-@patch(f"{BUILD}.Path.exists", side_effect=[True, True])
 @patch("builtins.open", new_callable=mock_open)
 @patch(
-    f"{BUILD}.json.loads",
+    f"{BUILD}._json_loads",
     return_value={
         "argv": [
             "some/path/bin/python.sh",
@@ -245,7 +276,6 @@ def test_ipykernel_attach_bashrc_already_mounted(
     mock_print: Mock,
     mock_json_loads: Mock,
     mock_file_open: Mock,
-    mock_exists: Mock,
     mock_get_kernels_dict: Mock,
 ) -> None:
     project_name = "existing_project"
@@ -256,13 +286,30 @@ def test_ipykernel_attach_bashrc_already_mounted(
         ipykernel_attach_bashrc(project_name)
 
     assert mock_get_kernels_dict.call_count == 1
-    assert mock_exists.call_count == 2
     assert mock_file_open.call_count == 1
     assert mock_json_loads.call_count == 1
     assert mock_print.call_args[0][0] == expected_print_message
     assert cm.exception.code == expected_exit_code
 
 
+@patch(f"{BUILD}.get_kernels_dict")
+@patch(f"{BUILD}.os.replace", side_effect=OSError("replace failed"))
+def test_ipykernel_attach_bashrc_removes_temp_file_on_failure(
+    mock_replace: Mock, mock_get_kernels_dict: Mock, tmp_path: Path
+) -> None:
+    kernel_json_file = tmp_path / "kernel.json"
+    kernel_json_file.write_text(
+        '{"argv": ["/some/path/bin/python3", "-m", "ipykernel_launcher"]}'
+    )
+    mock_get_kernels_dict.return_value = {"project_name": str(tmp_path)}
+
+    with pytest.raises(OSError):
+        ipykernel_attach_bashrc("project_name")
+
+    assert not (tmp_path / "kernel.json.tmp").exists()
+    assert "python3" in kernel_json_file.read_text()
+
+
 def test_find_python_executable_path() -> None:
     test_data = [
         "some/path/bin/python3",
@@ -289,18 +336,40 @@ def test_not_find_python_executable_path() -> None:
     assert _get_python_executable_path(test_data_no_python_path) == expected_result
 
 
-@patch("builtins.open", new_callable=mock_open)
-def test_write_start_script(mock_file_open: Mock) -> None:
-    start_script_path = "/some/place/to/put/test_start_script.sh"
+@patch(f"{BUILD}.orjson", None)
+def test_json_round_trip_without_orjson() -> None:
+    content = {"argv": ["/path/to/bin/python3", "-m", "ipykernel_launcher"]}
+
+    assert _json_loads(_json_dumps(content)) == content
+
+
+@patch(f"{BUILD}.orjson")
+def test_json_uses_orjson_when_installed(mock_orjson: Mock) -> None:
+    mock_orjson.loads.return_value = {"argv": []}
+    mock_orjson.dumps.return_value = b'{"argv":[]}'
+
+    assert _json_loads(b'{"argv":[]}') == {"argv": []}
+    assert _json_dumps({"argv": []}) == b'{"argv":[]}'
+    mock_orjson.loads.assert_called_once_with(b'{"argv":[]}')
+    mock_orjson.dumps.assert_called_once_with({"argv": []})
+
+
+@patch(f"{BUILD}.importlib.import_module", side_effect=ImportError)
+def test_import_orjson_not_installed(mock_import_module: Mock) -> None:
+    assert _import_orjson() is None
+
+
+def test_write_start_script(tmp_path: Path) -> None:
+    start_script_path = tmp_path / "test_start_script.sh"
     python_executable_path = "/path/to/bin/python3"
 
-    expected_content = [
-        "#!/usr/bin/env bash\n",
-        "source $HOME/.bashrc\n",
-        "exec /path/to/bin/python3 $@",
-    ]
+    expected_content = (
+        "#!/usr/bin/env bash\n"
+        "source $HOME/.bashrc\n"
+        "exec /path/to/bin/python3 $@\n"
+    )
 
-    _write_start_script(start_script_path, python_executable_path)
+    _write_start_script(str(start_script_path), python_executable_path)
 
-    mock_file_open.assert_called_once_with(start_script_path, "w", encoding="utf-8")
-    mock_file_open().writelines.assert_called_once_with(expected_content)
+    assert start_script_path.read_text() == expected_content
+    assert start_script_path.stat().st_mode & 0o777 == 0o555
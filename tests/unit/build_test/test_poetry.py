@@ -42,7 +42,11 @@ def test_poetry_update_lockfile_dependencies(mock_run: Mock) -> None:
 
 
 @patch(f"{POETRY}.execute_command")
-def test_poetry_source_includes_source_name(mock_run: Mock) -> None:
+def test_poetry_source_includes_source_name(mock_run: Mock, tmp_path: Path) -> None:
+    shutil.copyfile(
+        "tests/unit/build_test/test_files/test_nexus_source_update_pyproject.toml",
+        tmp_path / "pyproject.toml",
+    )
     mock_run.side_effect = [
         Mock(
             returncode=0,
@@ -51,10 +55,24 @@ def test_poetry_source_includes_source_name(mock_run: Mock) -> None:
         Mock(returncode=0, stdout=b"No sources configured for this project."),
         Mock(returncode=1, stderr=b"Some error"),
     ]
-    assert poetry_source_includes_source_name(Path("."), source_name=NEXUS_SOURCE_NAME)
+    assert poetry_source_includes_source_name(tmp_path, source_name=NEXUS_SOURCE_NAME)
+    assert not poetry_source_includes_source_name(
+        tmp_path, source_name=NEXUS_SOURCE_NAME
+    )
+
+
+@patch(f"{POETRY}.execute_command")
+def test_poetry_source_includes_source_name_not_in_pyproject(
+    mock_run: Mock, tmp_path: Path
+) -> None:
+    shutil.copyfile(
+        "tests/unit/build_test/test_files/test_nexus_source_add_pyproject.toml",
+        tmp_path / "pyproject.toml",
+    )
     assert not poetry_source_includes_source_name(
-        Path("."), source_name=NEXUS_SOURCE_NAME
+        tmp_path, source_name=NEXUS_SOURCE_NAME
     )
+    assert mock_run.call_count == 0
 
 
 @pytest.mark.parametrize(
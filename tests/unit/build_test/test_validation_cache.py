@@ -0,0 +1,91 @@
+"""Tests for the validation_cache module."""
+
+import os
+from pathlib import Path
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pytest
+
+from ssb_project_cli.ssb_project.build.validation_cache import is_git_config_validated
+from ssb_project_cli.ssb_project.build.validation_cache import mark_git_config_validated
+
+
+VALIDATION_CACHE = "ssb_project_cli.ssb_project.build.validation_cache"
+TEMPLATE_REPO_URL = "https://github.com/statisticsnorway/ssb-project-template-stat"
+
+
+def test_git_config_validated_roundtrip(tmp_path: Path) -> None:
+    project_root = tmp_path / "project"
+    project_root.mkdir()
+    (project_root / ".gitignore").write_text("*.csv\n")
+
+    assert not is_git_config_validated(
+        TEMPLATE_REPO_URL, "1.1.8", project_root, home_path=tmp_path
+    )
+
+    mark_git_config_validated(
+        TEMPLATE_REPO_URL, "1.1.8", project_root, home_path=tmp_path
+    )
+
+    assert is_git_config_validated(
+        TEMPLATE_REPO_URL, "1.1.8", project_root, home_path=tmp_path
+    )
+    assert not is_git_config_validated(
+        TEMPLATE_REPO_URL, "1.2.0", project_root, home_path=tmp_path
+    )
+
+
+def test_git_config_validated_invalidated_on_change(tmp_path: Path) -> None:
+    project_root = tmp_path / "project"
+    project_root.mkdir()
+    gitignore = project_root / ".gitignore"
+    gitignore.write_text("*.csv\n")
+
+    mark_git_config_validated(
+        TEMPLATE_REPO_URL, "1.1.8", project_root, home_path=tmp_path
+    )
+    mtime_ns = gitignore.stat().st_mtime_ns + 1_000_000_000
+    os.utime(gitignore, ns=(mtime_ns, mtime_ns))
+
+    assert not is_git_config_validated(
+        TEMPLATE_REPO_URL, "1.1.8", project_root, home_path=tmp_path
+    )
+
+
+def test_git_config_validated_corrupt_cache(tmp_path: Path) -> None:
+    cache_file = tmp_path / ".cache" / "ssb-project" / "git-config-validated.json"
+    cache_file.parent.mkdir(parents=True)
+    cache_file.write_text("not json")
+
+    assert not is_git_config_validated(
+        TEMPLATE_REPO_URL, "1.1.8", tmp_path, home_path=tmp_path
+    )
+
+
+@patch(f"{VALIDATION_CACHE}.version")
+def test_git_config_validated_invalidated_on_kvakk_upgrade(
+    mock_version: Mock, tmp_path: Path
+) -> None:
+    mock_version.return_value = "2.4.2"
+    mark_git_config_validated(TEMPLATE_REPO_URL, "1.1.8", tmp_path, home_path=tmp_path)
+    assert is_git_config_validated(
+        TEMPLATE_REPO_URL, "1.1.8", tmp_path, home_path=tmp_path
+    )
+
+    mock_version.return_value = "2.5.0"
+    assert not is_git_config_validated(
+        TEMPLATE_REPO_URL, "1.1.8", tmp_path, home_path=tmp_path
+    )
+
+
+def test_git_config_validated_invalidated_on_platform_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("DAPLA_REGION", "BIP")
+    mark_git_config_validated(TEMPLATE_REPO_URL, "1.1.8", tmp_path, home_path=tmp_path)
+
+    monkeypatch.setenv("DAPLA_REGION", "DAPLA_LAB")
+    assert not is_git_config_validated(
+        TEMPLATE_REPO_URL, "1.1.8", tmp_path, home_path=tmp_path
+    )
@@ -1,10 +1,13 @@
 """Tests for the clean module."""
 
+from pathlib import Path
 from unittest.mock import Mock
 from unittest.mock import patch
 
 import pytest
 
+from ssb_project_cli.ssb_project.clean.clean import KERNEL_CHOICE
+from ssb_project_cli.ssb_project.clean.clean import VENV_CHOICE
 from ssb_project_cli.ssb_project.clean.clean import clean_project
 from ssb_project_cli.ssb_project.clean.clean import clean_venv
 
@@ -12,35 +15,159 @@ from ssb_project_cli.ssb_project.clean.clean import clean_venv
 CLEAN = "ssb_project_cli.ssb_project.clean.clean"
 
 
+@patch(f"{CLEAN}.remove_kernel_spec")
 @patch(f"{CLEAN}.clean_venv")
 @patch(f"{CLEAN}.get_kernels_dict")
+@patch(f"{CLEAN}.questionary")
 def test_clean(
+    mock_questionary: Mock,
     mock_kernels: Mock,
     mock_clean_venv: Mock,
+    mock_remove_kernel_spec: Mock,
 ) -> None:
     """Check if the function works correctly and raises the expected errors."""
     project_name = "test-project"
     mock_kernels.return_value = {}
+    mock_questionary.checkbox().ask.return_value = [VENV_CHOICE]
 
     with pytest.raises(SystemExit):
         clean_project(project_name)
 
+    # Only the virtual environment is offered when the kernel is missing
+    choices = mock_questionary.checkbox.call_args.kwargs["choices"]
+    assert len(choices) == 1
+    assert mock_clean_venv.call_count == 1
+    assert mock_remove_kernel_spec.call_count == 0
+
+
+@patch(f"{CLEAN}.remove_kernel_spec")
+@patch(f"{CLEAN}.clean_venv")
+@patch(f"{CLEAN}.get_kernels_dict", return_value={})
+@patch(f"{CLEAN}.questionary")
+def test_clean_assume_yes_without_kernel(
+    mock_questionary: Mock,
+    mock_kernels: Mock,
+    mock_clean_venv: Mock,
+    mock_remove_kernel_spec: Mock,
+) -> None:
+    """Check that the virtual environment is removed even if the kernel is missing."""
+    with pytest.raises(SystemExit):
+        clean_project("test-project", assume_yes=True)
+
+    assert mock_questionary.checkbox.call_count == 0
     assert mock_clean_venv.call_count == 1
+    assert mock_remove_kernel_spec.call_count == 0
+
+
+@patch(f"{CLEAN}.remove_kernel_spec")
+@patch(f"{CLEAN}.clean_venv")
+@patch(f"{CLEAN}.get_kernels_dict", return_value={"test-project": "/path"})
+@patch(f"{CLEAN}.questionary")
+@pytest.mark.parametrize(
+    "selected,calls_to_clean_venv,calls_to_remove_kernel_spec",
+    [
+        ([KERNEL_CHOICE, VENV_CHOICE], 1, 1),
+        ([KERNEL_CHOICE], 0, 1),
+        ([VENV_CHOICE], 1, 0),
+    ],
+)
+def test_clean_selected(
+    mock_questionary: Mock,
+    mock_kernels: Mock,
+    mock_clean_venv: Mock,
+    mock_remove_kernel_spec: Mock,
+    selected: list[str],
+    calls_to_clean_venv: int,
+    calls_to_remove_kernel_spec: int,
+) -> None:
+    """Check that only the selected items are deleted, with a single prompt."""
+    mock_questionary.checkbox().ask.return_value = selected
+    mock_questionary.checkbox.reset_mock()
+
+    clean_project("test-project")
+
+    assert mock_questionary.checkbox.call_count == 1
+    assert mock_clean_venv.call_count == calls_to_clean_venv
+    assert mock_remove_kernel_spec.call_count == calls_to_remove_kernel_spec
+
+
+@patch(f"{CLEAN}.remove_kernel_spec")
+@patch(f"{CLEAN}.clean_venv")
+@patch(f"{CLEAN}.get_kernels_dict", return_value={"test-project": "/path"})
+@patch(f"{CLEAN}.questionary")
+def test_clean_nothing_selected(
+    mock_questionary: Mock,
+    mock_kernels: Mock,
+    mock_clean_venv: Mock,
+    mock_remove_kernel_spec: Mock,
+) -> None:
+    """Check that cancelling the prompt exits without deleting anything."""
+    mock_questionary.checkbox().ask.return_value = None
+
+    with pytest.raises(SystemExit):
+        clean_project("test-project")
+
+    assert mock_clean_venv.call_count == 0
+    assert mock_remove_kernel_spec.call_count == 0
 
 
-@patch(f"{CLEAN}.execute_command")
-@patch(f"{CLEAN}.Path.is_dir")
+@patch(f"{CLEAN}.remove_kernel_spec")
+@patch(f"{CLEAN}.clean_venv")
+@patch(f"{CLEAN}.get_kernels_dict", return_value={"test-project": "/path"})
 @patch(f"{CLEAN}.questionary")
-def test_clean_venv(mock_confirm: Mock, mock_path: Mock, mock_execute: Mock) -> None:
-    """Check that execute command runs"""
-    mock_confirm.confirm().ask.return_value = True
-    mock_path.is_dir.return_value = True
+def test_clean_assume_yes(
+    mock_questionary: Mock,
+    mock_kernels: Mock,
+    mock_clean_venv: Mock,
+    mock_remove_kernel_spec: Mock,
+) -> None:
+    """Check that no prompt is shown when confirmation is assumed."""
+    clean_project("test-project", assume_yes=True)
+
+    assert mock_questionary.checkbox.call_count == 0
+    assert mock_clean_venv.call_count == 1
+    mock_remove_kernel_spec.assert_called_once_with("test-project")
 
+
+def test_clean_venv(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check that the virtual environment is removed if it exists."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".venv" / "bin").mkdir(parents=True)
+
+    clean_venv()
+
+    assert not (tmp_path / ".venv").exists()
+
+    # Nothing to remove, should not fail
     clean_venv()
 
-    mock_confirm.confirm().ask.return_value = True
-    mock_path.is_dir.return_value = False
+
+def test_clean_venv_symlink(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check that a symlinked virtual environment is unlinked, not followed."""
+    monkeypatch.chdir(tmp_path)
+    target = tmp_path / "elsewhere"
+    (target / "bin").mkdir(parents=True)
+    (tmp_path / ".venv").symlink_to(target)
 
     clean_venv()
 
-    assert mock_execute.call_count == 2
+    assert not (tmp_path / ".venv").is_symlink()
+    assert (target / "bin").is_dir()
+
+
+@patch(f"{CLEAN}.create_error_log")
+@patch(f"{CLEAN}.shutil.rmtree", side_effect=PermissionError("denied"))
+def test_clean_venv_failure(
+    mock_rmtree: Mock,
+    mock_create_log: Mock,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Check that a failed removal is logged and exits."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".venv").mkdir()
+
+    with pytest.raises(SystemExit):
+        clean_venv()
+
+    assert mock_create_log.call_count == 1
@@ -220,7 +220,7 @@ def test_is_valid_project_name() -> None:
     assert is_valid_project_name("123randomletteRs") == False  # noqa: E712
 
 
-@patch("ssb_project_cli.ssb_project.app.create_project", return_value=None)
+@patch("ssb_project_cli.ssb_project.create.create.create_project", return_value=None)
 def test_default_options_and_types(mock_create_project: Mock) -> None:
     """Check default options and types retuned by the create typer CLI command."""
     # Check when all optional parameters are given
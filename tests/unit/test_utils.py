@@ -10,7 +10,9 @@ import pytest
 import tomli_w
 
 from ssb_project_cli.ssb_project.util import execute_command
+from ssb_project_cli.ssb_project.util import get_kernels_dict
 from ssb_project_cli.ssb_project.util import get_project_name_and_root_path
+from ssb_project_cli.ssb_project.util import invalidate_kernels_dict
 from ssb_project_cli.ssb_project.util import set_debug_logging
 
 
@@ -51,6 +53,22 @@ def test_execute_command_success(mock_run: Mock, mock_print: Mock) -> None:
     mock_print.assert_called_with("Success")
 
 
+@patch(f"{UTILS}._kernelspec_manager")
+def test_get_kernels_dict_cached(mock_kernelspec_manager: Mock) -> None:
+    """The kernel directories are only scanned again after invalidation."""
+    mock_kernelspec_manager().find_kernel_specs.return_value = {"kernel": "/path"}
+    invalidate_kernels_dict()
+
+    assert get_kernels_dict() == {"kernel": "/path"}
+    assert get_kernels_dict() == {"kernel": "/path"}
+    assert mock_kernelspec_manager().find_kernel_specs.call_count == 1
+
+    invalidate_kernels_dict()
+    get_kernels_dict()
+    assert mock_kernelspec_manager().find_kernel_specs.call_count == 2
+    invalidate_kernels_dict()
+
+
 def test_set_debug_logging_folders_created() -> None:
     with tempfile.TemporaryDirectory() as tempdir:
         error_logs_path = Path(f"{tempdir}/ssb-project-cli/.error_logs/")
@@ -74,6 +92,15 @@ def test_get_project_name_pyproject_toml(tmp_path: Path) -> None:
     assert get_project_name_and_root_path(tmp_path) == (name, tmp_path)
 
 
+def test_get_project_name_invalid_cruft_json_falls_back(tmp_path: Path) -> None:
+    name = "my-project-name"
+    (tmp_path / ".cruft.json").write_text("{}")
+    content = {"tool": {"poetry": {"name": name}}}
+    with (tmp_path / "pyproject.toml").open("w") as f:
+        f.write(tomli_w.dumps(content))
+    assert get_project_name_and_root_path(tmp_path) == (name, tmp_path)
+
+
 def test_get_project_name_git_directory(tmp_path: Path) -> None:
     (tmp_path / ".git").mkdir()
     assert get_project_name_and_root_path(tmp_path) == (tmp_path.name, tmp_path)